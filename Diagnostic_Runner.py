@@ -4,15 +4,25 @@ import time
 import json
 import logging
 import argparse
-
+import functools
+import html
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import orjson
 from seleniumwire import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from jinja2 import Template
+from selenium.common.exceptions import (
+    InvalidArgumentException, TimeoutException, WebDriverException
+)
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
 
 # ─────────────────────────────────────────────────────────────────────────────
-HTML_TEMPLATE = """
+HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -30,7 +40,11 @@ HTML_TEMPLATE = """
 </head>
 <body>
   <h1>Smart Diagnostics Report</h1>
-  {% for page, data in report.pages.items() %}
+"""
+HTML_TAIL = """</body>
+</html>
+"""
+HTML_TEMPLATE = HTML_HEAD + """  {% for page, data in report.pages.items() %}
     <h2>{{ page }}</h2>
 
     <h3>Performance</h3>
@@ -45,16 +59,16 @@ HTML_TEMPLATE = """
     </p>
 
     <h3>Console Issues</h3>
-    {% for level in ['errors','warnings','deprecations'] %}
-      <p>{{ level.title() }}:
-        <span class="{{ 'error' if level=='errors' else 'warn' }}">
-          {{ data.console_issues[level]|length }}
+    {% for title, css, messages in console_rows[page] %}
+      <p>{{ title }}:
+        <span class="{{ css }}">
+          {{ messages|length }}
         </span>
       </p>
-      {% if data.console_issues[level] %}
+      {% if messages %}
       <table>
         <tr><th>Message</th></tr>
-        {% for msg in data.console_issues[level] %}
+        {% for msg in messages %}
           <tr><td>{{ msg }}</td></tr>
         {% endfor %}
       </table>
@@ -72,8 +86,12 @@ HTML_TEMPLATE = """
     <p>
       Missing/404: <span class="error">{{ data.resource_issues.missing_or_404|length }}</span>,
       Slow: <span class="warn">{{ data.resource_issues.slow_resources_ms|length }}</span>,
+      {% if report.standard.resource.skip_images %}
+      Oversized Images: <span class="warn">skipped</span>
+      {% else %}
       Oversized Images: <span class="error">{{ data.resource_issues.oversized_images|length }}</span>
       (Max {{ report.standard.resource.image_max_kb }} KB)
+      {% endif %}
     </p>
     {% if data.resource_issues.oversized_images %}
       <table>
@@ -95,9 +113,17 @@ HTML_TEMPLATE = """
     {% endif %}
 
   {% endfor %}
-</body>
-</html>
-"""
+""" + HTML_TAIL
+
+# compiled template code is pickled here so warm starts skip lex/parse/compile
+JINJA_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache")
+
+# hosts selenium-wire lets bypass its proxy entirely (never captured)
+BLOCKED_HOSTS = frozenset({
+    "clients2.google.com",        # Chrome time-sync
+    "www.google-analytics.com",
+    "fonts.gstatic.com",
+})
 # ─────────────────────────────────────────────────────────────────────────────
 
 def load_urls_from_file(path: str) -> list:
@@ -120,6 +146,109 @@ def load_urls_from_file(path: str) -> list:
     return [line.strip() for line in content.splitlines() if line.strip()]
 
 
+def _ensure_parent_dir(path: str):
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _bytecode_cache():
+    """Bytecode cache in JINJA_CACHE_DIR, or None if it can't be written."""
+    try:
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(JINJA_CACHE_DIR, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(directory=JINJA_CACHE_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def _report_template():
+    """Jinja HTML template, built on first use since --jinja is opt-in."""
+    env = Environment(
+        loader=DictLoader({"report.html": HTML_TEMPLATE}),
+        bytecode_cache=_bytecode_cache(),
+        autoescape=True,
+        auto_reload=False
+    )
+    return env.get_template("report.html")
+
+
+def _verdict(failed: bool) -> str:
+    return '<span class="error">FAIL</span>' if failed else '<span class="ok">PASS</span>'
+
+
+def _render_report_html(report, console_rows: dict) -> str:
+    """Hand-written equivalent of HTML_TEMPLATE, without Jinja's per-node overhead."""
+    esc = html.escape
+    load_std = report.standard["performance"]["page_load_ms"]
+    img_std = report.standard["resource"]["image_max_kb"]
+    skip_images = report.standard["resource"].get("skip_images")
+
+    parts = [HTML_HEAD]
+    for page, data in report.pages.items():
+        load_ms = data["performance"]["page_load_time_ms"]
+        api, res = data["api_issues"], data["resource_issues"]
+        if skip_images:
+            images = 'Oversized Images: <span class="warn">skipped</span>'
+        else:
+            images = (
+                f'Oversized Images: <span class="error">{len(res["oversized_images"])}</span>'
+                f" (Max {img_std} KB)"
+            )
+
+        parts.append(
+            f"  <h2>{esc(page)}</h2>\n"
+            f"  <h3>Performance</h3>\n"
+            f"  <p>Load Time: <strong>{load_ms} ms</strong>"
+            f" (Expected ≤ {load_std} ms) {_verdict(load_ms > load_std)}</p>\n"
+            f"  <h3>Console Issues</h3>\n"
+        )
+        for title, css, messages in console_rows[page]:
+            parts.append(f'  <p>{title}: <span class="{css}">{len(messages)}</span></p>\n')
+            if messages:
+                parts.append("  <table>\n    <tr><th>Message</th></tr>\n")
+                parts.extend(f"    <tr><td>{esc(msg)}</td></tr>\n" for msg in messages)
+                parts.append("  </table>\n")
+
+        parts.append(
+            f"  <h3>API Issues</h3>\n"
+            f'  <p>Errors: <span class="error">{len(api["errors"])}</span>,'
+            f' Timeouts: <span class="warn">{len(api["timeouts"])}</span>,'
+            f' Slow: <span class="warn">{len(api["slow_responses_ms"])}</span></p>\n'
+            f"  <h3>Resource Issues</h3>\n"
+            f'  <p>Missing/404: <span class="error">{len(res["missing_or_404"])}</span>,'
+            f' Slow: <span class="warn">{len(res["slow_resources_ms"])}</span>,'
+            f" {images}</p>\n"
+        )
+        if res["oversized_images"]:
+            parts.append(
+                "  <table>\n"
+                "    <tr><th>URL</th><th>Size (KB)</th><th>Result</th></tr>\n"
+            )
+            parts.extend(
+                f"    <tr><td>{esc(img['url'])}</td><td>{img['size_kb']}</td>"
+                f"<td>{_verdict(img['size_kb'] > img_std)}</td></tr>\n"
+                for img in res["oversized_images"]
+            )
+            parts.append("  </table>\n")
+
+    parts.append(HTML_TAIL)
+    return "".join(parts)
+
+
+def _page_chunk(url: str, page: dict) -> bytes:
+    """One `"url": {...}` entry of the JSON report's pages object."""
+    chunk = orjson.dumps(page, option=orjson.OPT_INDENT_2)
+    return b"    " + orjson.dumps(url) + b": " + chunk.replace(b"\n", b"\n    ")
+
+
+def _new_capture() -> dict:
+    """Per-driver network state, shared with selenium-wire's proxy threads."""
+    return {"pending": {}, "api_issues": None, "lock": threading.Lock()}
+
+
 class SmartDiagnosticsRunner:
     def __init__(
         self,
@@ -129,6 +258,10 @@ class SmartDiagnosticsRunner:
         res_slow_th: int = 2000,
         api_slow_th: int = 3000,
         image_size_standard_kb: int = 5,
+        workers: int = 4,
+        capture_scopes: list = None,
+        skip_images: bool = False,
+        use_jinja: bool = False,
         log_level: int = logging.INFO
     ):
         logging.basicConfig(
@@ -138,22 +271,19 @@ class SmartDiagnosticsRunner:
         )
         self.logger = logging.getLogger("SmartDiagnostics")
 
-        opts = Options()
-        if headless:
-            opts.add_argument("--headless=new")
-        opts.add_argument("--disable-gpu")
-        opts.add_argument("--disable-extensions")
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        # Disable Chrome time‐sync pings
-        opts.add_argument(
-            "--disable-features=NetworkTimeService,NetworkTimeServiceQuerying"
-        )
-        opts.add_argument("--disable-background-networking")
-        opts.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        self.headless = headless
+        self.workers = max(1, workers)
+        # optional allow-list of URL regexes to capture (None = everything)
+        self.capture_scopes = capture_scopes
+        # don't load images at all (also disables oversized-image checks)
+        self.skip_images = skip_images
+        # render HTML through the Jinja template instead of _render_report_html
+        self.use_jinja = use_jinja
 
-        self.driver = webdriver.Chrome(service=Service(), options=opts)
-        self.driver.set_page_load_timeout(page_load_timeout)
+        # one Chrome per worker thread, created lazily on first use
+        self._local = threading.local()
+        self._drivers = []
+        self._lock = threading.Lock()
 
         # thresholds & standards
         self.page_load_timeout = page_load_timeout
@@ -167,20 +297,153 @@ class SmartDiagnosticsRunner:
         self.report.pages = {}
         self.report.standard = {
             "performance": {"page_load_ms": page_load_standard_ms},
-            "resource":    {"image_max_kb": image_size_standard_kb}
+            "resource":    {
+                "image_max_kb": image_size_standard_kb,
+                # the oversized-image check doesn't run when images are blocked
+                "skip_images": skip_images
+            }
+        }
+
+    def _make_driver(self, capture: dict):
+        opts = Options()
+        if self.headless:
+            opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
+        opts.add_argument("--disable-extensions")
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        # Disable Chrome time‐sync pings
+        opts.add_argument(
+            "--disable-features=NetworkTimeService,NetworkTimeServiceQuerying"
+        )
+        opts.add_argument("--disable-background-networking")
+        opts.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        if self.skip_images:
+            opts.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+
+        wire_opts = {
+            "exclude_hosts": sorted(BLOCKED_HOSTS),
+            "disable_capture": False,
+            "request_storage": "memory",
+            # issues are collected by the interceptors, nothing is kept
+            "request_storage_max_size": 1,
         }
 
+        driver = webdriver.Chrome(
+            service=Service(), options=opts, seleniumwire_options=wire_opts
+        )
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.capture_scopes:
+            driver.scopes = self.capture_scopes
+        driver.request_interceptor = (
+            lambda req: self._on_request(capture, req)
+        )
+        driver.response_interceptor = (
+            lambda req, resp: self._on_response(capture, req, resp)
+        )
+        return driver
+
+    @property
+    def driver(self):
+        """The Chrome driver owned by the calling worker thread."""
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            # per-driver network state, filled in from the proxy threads
+            self._local.capture = _new_capture()
+            driver = self._make_driver(self._local.capture)
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _drop_driver(self):
+        """Quit the calling thread's driver so its next page starts a new one."""
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            return
+        self._local.driver = None
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            self.logger.exception("Failed to quit driver")
+
+    def _quit_drivers(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                self.logger.exception("Failed to quit driver")
+
     def run(self, urls: list, json_path: str, html_path: str):
+        # never launch more Chromes than there are pages to visit
+        workers = max(1, min(self.workers, len(urls)))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(self._diagnose, url): url for url in urls}
+            for future in as_completed(futures):
+                # one failing page must not abort the rest of the batch
+                try:
+                    future.result()
+                except Exception:
+                    self.logger.exception("Failed to diagnose %s", futures[future])
+        except BaseException:
+            # Ctrl-C or a fatal error: don't start the queued pages
+            pool.shutdown(cancel_futures=True)
+            raise
+        else:
+            pool.shutdown()
+        finally:
+            # pages finish in any order; report them in input order
+            pages = self.report.pages
+            self.report.pages = {url: pages[url] for url in urls if url in pages}
+            self._write_reports(json_path, html_path)
+            self._quit_drivers()
+
+    def run_daemon(self, stream, json_path: str, html_path: str):
+        """
+        Diagnose URLs read line by line from `stream` until EOF, reusing a
+        single Chrome; the JSON report is rewritten after every page.
+        """
+        _ensure_parent_dir(json_path)
+        # each page is serialized once; flushes only re-copy the bytes
+        chunks = {}
         try:
-            for url in urls:
-                self._process_page(url)
+            for line in stream:
+                url = line.strip()
+                if not url:
+                    continue
+                # one bad line must not end the daemon
+                try:
+                    self._diagnose(url)
+                except Exception:
+                    self.logger.exception("Failed to diagnose %s", url)
+                    continue
+                chunks[url] = _page_chunk(url, self.report.pages[url])
+                self._stream_json_report(json_path, chunks.values())
         finally:
             self._write_reports(json_path, html_path)
-            self.driver.quit()
+            self._quit_drivers()
+
+    def _diagnose(self, url: str):
+        try:
+            self._process_page(url)
+        except (InvalidArgumentException, TimeoutException):
+            raise
+        except WebDriverException:
+            # Chrome crashed or the session is gone; don't reuse the driver
+            self._drop_driver()
+            raise
 
     def _process_page(self, url: str):
         self.logger.info("Visiting %s", url)
-        self.driver.requests.clear()
 
         page = {
             "performance": {"page_load_time_ms": 0},
@@ -191,33 +454,76 @@ class SmartDiagnosticsRunner:
             }
         }
 
+        # route this driver's proxy traffic into the new page
+        driver = self.driver
+        capture = self._local.capture
+        with capture["lock"]:
+            capture["pending"] = {}
+            capture["api_issues"] = page["api_issues"]
+
         start = time.time()
         try:
-            self.driver.get(url)
+            driver.get(url)
         except TimeoutException:
             self.logger.warning(
                 "Page load timed out after %ds: %s",
                 self.page_load_timeout, url
             )
 
-        # wait up to standard page load time for readyState
         elapsed = time.time() - start
-        while elapsed * 1000 < self.page_load_standard_ms:
-            if self.driver.execute_script("return document.readyState") == "complete":
-                break
-            time.sleep(0.1)
-            elapsed = time.time() - start
 
-        page["performance"]["page_load_time_ms"] = round(elapsed * 1000)
         self._capture_console(page)
         self._capture_network_and_resources(page)
+        # no navigation timing when the load event never fired (e.g. timeout)
+        if not page["performance"]["page_load_time_ms"]:
+            page["performance"]["page_load_time_ms"] = round(elapsed * 1000)
 
-        self.report.pages[url] = page
+        with self._lock:
+            self.report.pages[url] = page
         self.logger.info("Finished %s in %d ms", url, page["performance"]["page_load_time_ms"])
 
+    def _on_request(self, capture: dict, req):
+        if urlsplit(req.url).hostname in BLOCKED_HOSTS:
+            return
+        # req.id isn't assigned until after the interceptors run, and the
+        # response side gets a rebuilt Request, so match on method + URL
+        with capture["lock"]:
+            capture["pending"].setdefault((req.method, req.url), deque()).append(req.date)
+
+    def _on_response(self, capture: dict, req, resp):
+        if urlsplit(req.url).hostname in BLOCKED_HOSTS:
+            return
+        with capture["lock"]:
+            try:
+                start = capture["pending"][(req.method, req.url)].popleft()
+            except (KeyError, IndexError):
+                start = None
+            issues = capture["api_issues"]
+            if issues is None:
+                return
+
+            status = resp.status_code
+            if status >= 400:
+                issues["errors"].append({
+                    "url": req.url, "status": status, "method": req.method
+                })
+
+            finish = getattr(resp, "date", None)
+            if start and finish:
+                ms = (finish - start).total_seconds() * 1000
+                if ms > self.api_slow_th:
+                    issues["slow_responses_ms"].append({
+                        "url": req.url, "duration_ms": round(ms)
+                    })
+
     def _capture_console(self, page: dict):
+        seen = set()
         for entry in self.driver.get_log("browser"):
             msg, lvl = entry["message"], entry["level"].upper()
+            # SPAs repeat the same message many times; keep one copy per page
+            if msg in seen:
+                continue
+            seen.add(msg)
             if "deprecated" in msg.lower():
                 page["console_issues"]["deprecations"].append(msg)
             elif lvl == "SEVERE":
@@ -228,63 +534,98 @@ class SmartDiagnosticsRunner:
     def _capture_network_and_resources(self, page: dict):
         try:
             resources = self.driver.execute_script(
-                """return performance.getEntriesByType('resource')
-                    .map(r => ({
-                      name: r.name,
-                      type: r.initiatorType,
-                      duration: Math.round(r.duration),
-                      size: Math.round(r.encodedBodySize)
-                    }));"""
+                """const [slowTh, imgMaxKb, checkImgs] = arguments;
+                const slow = [], bigImgs = [];
+                for (const r of performance.getEntriesByType('resource')) {
+                  const duration = Math.round(r.duration);
+                  const size = Math.round(r.encodedBodySize);
+                  if (duration > slowTh) {
+                    slow.push({name: r.name, type: r.initiatorType, duration, size});
+                  }
+                  if (checkImgs && r.initiatorType === 'img') {
+                    const sizeKb = Math.round(size / 102.4) / 10;
+                    if (sizeKb > imgMaxKb) bigImgs.push({url: r.name, size_kb: sizeKb});
+                  }
+                }
+                const nav = performance.getEntriesByType('navigation')[0];
+                return {slow, bigImgs, navTiming: nav ? nav.duration : 0};""",
+                self.res_slow_th, self.image_size_standard_kb, not self.skip_images
             )
         except Exception:
-            resources = []
-
-        for r in resources:
-            if r["duration"] > self.res_slow_th:
-                page["resource_issues"]["slow_resources_ms"].append(r)
-            if r["type"] == "img":
-                size_kb = round(r["size"] / 1024, 1)
-                if size_kb > self.image_size_standard_kb:
-                    page["resource_issues"]["oversized_images"].append({
-                        "url": r["name"], "size_kb": size_kb
-                    })
-
-        for req in self.driver.requests:
-            # skip Chrome time‐sync
-            if "clients2.google.com/time/1/current" in req.url:
-                continue
-
-            if not req.response:
-                page["api_issues"]["timeouts"].append({
-                    "url": req.url, "method": req.method
-                })
-                continue
-
-            status = req.response.status_code
-            if status >= 400:
-                page["api_issues"]["errors"].append({
-                    "url": req.url, "status": status, "method": req.method
-                })
+            resources = {"slow": [], "bigImgs": [], "navTiming": 0}
+
+        page["resource_issues"]["slow_resources_ms"] = resources["slow"]
+        page["resource_issues"]["oversized_images"] = resources["bigImgs"]
+        page["performance"]["page_load_time_ms"] = round(resources["navTiming"])
+
+        self._finish_capture(self._local.capture, page)
+
+    def _finish_capture(self, capture: dict, page: dict):
+        # whatever never got a response is reported as a timeout; detach the
+        # page first so late responses don't land in a finished report. The
+        # proxy threads only touch capture under its lock, so once swapped
+        # out the old pending map is ours alone.
+        with capture["lock"]:
+            capture["api_issues"] = None
+            pending, capture["pending"] = capture["pending"], {}
+        for (method, url), starts in pending.items():
+            page["api_issues"]["timeouts"].extend(
+                {"url": url, "method": method} for _ in starts
+            )
 
-            start, finish = getattr(req, "date", None), getattr(req.response, "date", None)
-            if start and finish:
-                ms = (finish - start).total_seconds() * 1000
-                if ms > self.api_slow_th:
-                    page["api_issues"]["slow_responses_ms"].append({
-                        "url": req.url, "duration_ms": round(ms)
-                    })
+    def _stream_json_report(self, path: str, chunks=None):
+        """
+        Write the JSON report one page at a time, so peak memory is bounded
+        by the largest page rather than the whole report. `chunks` may hold
+        pages already serialized by _page_chunk. The file is replaced
+        atomically, so a killed run never leaves a truncated report.
+        """
+        if chunks is None:
+            with self._lock:
+                pages = list(self.report.pages.items())
+            chunks = (_page_chunk(url, page) for url, page in pages)
+
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as jf:
+                jf.write(b'{\n  "pages": {')
+                sep = b"\n"
+                for chunk in chunks:
+                    jf.write(sep + chunk)
+                    sep = b",\n"
+                jf.write(b"},\n" if sep == b"\n" else b"\n  },\n")
+                standard = orjson.dumps(self.report.standard, option=orjson.OPT_INDENT_2)
+                jf.write(b'  "standard": ' + standard.replace(b"\n", b"\n  ") + b"\n}")
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _console_rows(self) -> dict:
+        """(title, css class, messages) per console level, keyed by page URL."""
+        rows = {}
+        for url, data in self.report.pages.items():
+            issues = data["console_issues"]
+            rows[url] = [
+                ("Errors", "error", issues["errors"]),
+                ("Warnings", "warn", issues["warnings"]),
+                ("Deprecations", "warn", issues["deprecations"]),
+            ]
+        return rows
 
     def _write_reports(self, json_path: str, html_path: str):
-        os.makedirs(os.path.dirname(json_path), exist_ok=True)
-        with open(json_path, "w") as jf:
-            json.dump({
-                "pages": self.report.pages,
-                "standard": self.report.standard
-            }, jf, indent=2)
-
-        tpl = Template(HTML_TEMPLATE)
+        _ensure_parent_dir(json_path)
+        self._stream_json_report(json_path)
+
+        console_rows = self._console_rows()
         with open(html_path, "w", encoding="utf-8") as hf:
-            hf.write(tpl.render(report=self.report))
+            if self.use_jinja:
+                hf.write(_report_template().render(
+                    report=self.report, console_rows=console_rows
+                ))
+            else:
+                hf.write(_render_report_html(self.report, console_rows))
         self.logger.info("Reports saved to %s and %s", json_path, html_path)
 
 
@@ -311,8 +652,38 @@ if __name__ == "__main__":
         default="reports/smart_report.html",
         help="Path for HTML report"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of parallel Chrome workers (default: 4)"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Read URLs from stdin until EOF, reusing one Chrome"
+    )
+    parser.add_argument(
+        "--skip-images",
+        action="store_true",
+        help="Block image loading and skip the oversized-image check"
+    )
+    parser.add_argument(
+        "--jinja",
+        action="store_true",
+        help="Render the HTML report with the Jinja template"
+    )
     args = parser.parse_args()
 
+    if args.daemon:
+        if args.urls or args.urls_file or args.workers is not None:
+            parser.error("--daemon reads URLs from stdin with one Chrome; "
+                         "it can't be combined with URLs, -f or --workers")
+        runner = SmartDiagnosticsRunner(
+            headless=True, skip_images=args.skip_images, use_jinja=args.jinja
+        )
+        runner.run_daemon(sys.stdin, args.json, args.html)
+        sys.exit(0)
+
     # Auto-detect a single-file argument if -f not used
     if args.urls_file:
         source = args.urls_file
@@ -329,5 +700,10 @@ if __name__ == "__main__":
     if not urls_to_test:
         parser.error("No URLs provided. Pass real URLs or a file of URLs (-f).")
 
-    runner = SmartDiagnosticsRunner(headless=True)
+    runner = SmartDiagnosticsRunner(
+        headless=True,
+        workers=4 if args.workers is None else args.workers,
+        skip_images=args.skip_images,
+        use_jinja=args.jinja
+    )
     runner.run(urls_to_test, args.json, args.html)
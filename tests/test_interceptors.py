@@ -0,0 +1,84 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("seleniumwire")
+pytest.importorskip("jinja2")
+pytest.importorskip("orjson")
+
+from seleniumwire.request import Request, Response
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Diagnostic_Runner import SmartDiagnosticsRunner, _new_capture  # noqa: E402
+
+
+def _runner():
+    runner = SmartDiagnosticsRunner.__new__(SmartDiagnosticsRunner)
+    runner.api_slow_th = 3000
+    return runner
+
+
+def _page():
+    return {"api_issues": {"errors": [], "timeouts": [], "slow_responses_ms": []}}
+
+
+def test_interceptors_match_requests_without_ids():
+    runner, page = _runner(), _page()
+    capture = _new_capture()
+    capture["api_issues"] = page["api_issues"]
+    t0 = datetime(2025, 1, 1)
+
+    # selenium-wire hands both interceptors Requests whose id is None
+    reqs = {}
+    for i, url in enumerate(["https://a.test/slow", "https://a.test/hang", "https://a.test/404"]):
+        reqs[url] = Request(method="GET", url=url, headers=[])
+        reqs[url].date = t0 + timedelta(milliseconds=i)
+        assert reqs[url].id is None
+        runner._on_request(capture, reqs[url])
+
+    def respond(url, status, after_ms):
+        resp = Response(status_code=status, reason="", headers=[])
+        resp.date = t0 + timedelta(milliseconds=after_ms)
+        # the response interceptor gets a freshly rebuilt Request
+        runner._on_response(capture, Request(method="GET", url=url, headers=[]), resp)
+
+    respond("https://a.test/404", 404, 50)
+    respond("https://a.test/slow", 200, 5000)
+    runner._finish_capture(capture, page)
+
+    assert page["api_issues"]["errors"] == [
+        {"url": "https://a.test/404", "status": 404, "method": "GET"}
+    ]
+    assert page["api_issues"]["slow_responses_ms"] == [
+        {"url": "https://a.test/slow", "duration_ms": 5000}
+    ]
+    assert page["api_issues"]["timeouts"] == [
+        {"url": "https://a.test/hang", "method": "GET"}
+    ]
+
+
+def test_repeated_url_is_timed_against_its_own_start():
+    runner, page = _runner(), _page()
+    capture = _new_capture()
+    capture["api_issues"] = page["api_issues"]
+    t0 = datetime(2025, 1, 1)
+
+    for ms in (0, 4000):
+        req = Request(method="GET", url="https://a.test/poll", headers=[])
+        req.date = t0 + timedelta(milliseconds=ms)
+        runner._on_request(capture, req)
+
+    resp = Response(status_code=200, reason="", headers=[])
+    resp.date = t0 + timedelta(milliseconds=4500)
+    runner._on_response(capture, Request(method="GET", url="https://a.test/poll", headers=[]), resp)
+    runner._finish_capture(capture, page)
+
+    assert page["api_issues"]["slow_responses_ms"] == [
+        {"url": "https://a.test/poll", "duration_ms": 4500}
+    ]
+    assert page["api_issues"]["timeouts"] == [
+        {"url": "https://a.test/poll", "method": "GET"}
+    ]
+
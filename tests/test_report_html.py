@@ -0,0 +1,37 @@
+import html
+import json
+import os
+import re
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("seleniumwire")
+pytest.importorskip("jinja2")
+pytest.importorskip("orjson")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from Diagnostic_Runner import (  # noqa: E402
+    SmartDiagnosticsRunner, _render_report_html, _report_template
+)
+
+
+def _normalize(markup):
+    markup = re.sub(r"\s*([<>])\s*", r"\1", markup)
+    return html.unescape(re.sub(r"\s+", " ", markup)).strip()
+
+
+@pytest.mark.parametrize("skip_images", [False, True])
+def test_writer_matches_jinja_template(skip_images):
+    with open(os.path.join(ROOT, "reports", "smart_report.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    data["standard"]["resource"]["skip_images"] = skip_images
+
+    runner = SmartDiagnosticsRunner.__new__(SmartDiagnosticsRunner)
+    runner.report = SimpleNamespace(pages=data["pages"], standard=data["standard"])
+    rows = runner._console_rows()
+
+    expected = _report_template().render(report=runner.report, console_rows=rows)
+    assert _normalize(_render_report_html(runner.report, rows)) == _normalize(expected)